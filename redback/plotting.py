@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from os.path import join
+import io
+from os.path import join, splitext
 from typing import Any, Union
 
 import matplotlib
+import matplotlib.collections
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -55,6 +57,9 @@ class Plotter(object):
     random_sample_color = KwargsAccessorWithDefault("random_sample_color", "red")
 
     bbox_inches = KwargsAccessorWithDefault("bbox_inches", "tight")
+    pil_kwargs = KwargsAccessorWithDefault("pil_kwargs", {"compress_level": 3})
+    buffered_save = KwargsAccessorWithDefault("buffered_save", False)
+    use_collection = KwargsAccessorWithDefault("use_collection", True)
     linewidth = KwargsAccessorWithDefault("linewidth", 2)
     zorder = KwargsAccessorWithDefault("zorder", -1)
 
@@ -106,6 +111,12 @@ class Plotter(object):
         :keyword max_likelihood_color: Color of the maximum likelihood curve.
         :keyword random_sample_color: Color of the random sample curves.
         :keyword bbox_inches: Setting for saving plots. Default is 'tight'.
+        :keyword pil_kwargs: Passed to Pillow when saving PNG files. Default is {'compress_level': 3},
+                             which saves faster than the Pillow default at the cost of slightly larger files.
+        :keyword buffered_save: Render the figure in memory and write the file in a single call.
+                                Useful on slow or network file systems. Default is False.
+        :keyword use_collection: Draw the random model curves as a single `LineCollection` instead of one line per
+                                 draw, which renders much faster. Default is True.
         :keyword linewidth: Same as matplotlib linewidth
         :keyword zorder: Same as matplotlib zorder
         :keyword xy: For `ax.annotate' x and y coordinates of the point to annotate.
@@ -255,10 +266,67 @@ class Plotter(object):
     _multiband_lightcurve_plot_filepath = _FilePathGetter(
         directory_property="_lightcurve_plot_outdir", filename_property="_multiband_lightcurve_plot_filename")
 
+    def _plot_random_models(
+            self, axes: matplotlib.axes.Axes, times: np.ndarray, random_ys: Union[list, np.ndarray],
+            color: Any, zorder: float) -> None:
+        """Plots the curves from random posterior draws.
+
+        :param axes: The axes to plot into.
+        :type axes: matplotlib.axes.Axes
+        :param times: The times at which the model was evaluated.
+        :type times: np.ndarray
+        :param random_ys: One array of model values per random draw.
+        :type random_ys: Union[list, np.ndarray]
+        :param color: Color of the curves.
+        :type color: Any
+        :param zorder: Same as matplotlib zorder.
+        :type zorder: float
+        """
+        if len(random_ys) == 0:
+            return
+        if self.use_collection:
+            segments = np.stack(np.broadcast_arrays(times, np.asarray(random_ys)), axis=-1)
+            collection = matplotlib.collections.LineCollection(
+                segments, colors=color, alpha=self.random_sample_alpha, linewidths=self.linewidth, zorder=zorder)
+            axes.add_collection(collection, autolim=False)
+            # update the data limits from the points, as ax.plot does, since the collection limits ignore log scales
+            axes.update_datalim(segments.reshape(-1, 2))
+            axes.autoscale_view()
+        else:
+            for ys in random_ys:
+                axes.plot(times, ys, color=color, alpha=self.random_sample_alpha, lw=self.linewidth, zorder=zorder)
+
+    @staticmethod
+    def _resolve_save_format(filepath: str) -> tuple:
+        """Determines the format a figure is saved in the same way `plt.savefig` does. Paths without an extension
+        get the `savefig.format` extension appended.
+
+        :param filepath: Path the figure is saved to.
+        :type filepath: str
+
+        :return: The path including the extension and the file format.
+        :rtype: tuple
+        """
+        file_format = splitext(filepath)[1][1:].lower()
+        if file_format == "":
+            file_format = matplotlib.rcParams["savefig.format"]
+            filepath = f"{filepath.rstrip('.')}.{file_format}"
+        return filepath, file_format
+
     def _save_and_show(self, filepath: str, save: bool, show: bool) -> None:
         plt.tight_layout()
         if save:
-            plt.savefig(filepath, dpi=self.dpi, bbox_inches=self.bbox_inches, transparent=False, facecolor='white')
+            filepath, file_format = self._resolve_save_format(filepath=filepath)
+            save_kwargs = dict(pil_kwargs=self.pil_kwargs) if file_format == "png" else dict()
+            if self.buffered_save:
+                buffer = io.BytesIO()
+                plt.savefig(buffer, format=file_format, dpi=self.dpi, bbox_inches=self.bbox_inches,
+                            transparent=False, facecolor='white', **save_kwargs)
+                with open(filepath, "wb") as f:
+                    f.write(buffer.getbuffer())
+            else:
+                plt.savefig(filepath, format=file_format, dpi=self.dpi, bbox_inches=self.bbox_inches,
+                            transparent=False, facecolor='white', **save_kwargs)
         if show:
             plt.show()
 
@@ -342,9 +410,8 @@ class IntegratedFluxPlotter(Plotter):
         random_ys_list = [self.model(times, **random_params, **self._model_kwargs)
                           for random_params in self._get_random_parameters()]
         if self.uncertainty_mode == "random_models":
-            for ys in random_ys_list:
-                axes.plot(times, ys, color=self.random_sample_color, alpha=self.random_sample_alpha, lw=self.linewidth,
-                          zorder=self.zorder)
+            self._plot_random_models(
+                axes=axes, times=times, random_ys=random_ys_list, color=self.random_sample_color, zorder=self.zorder)
         elif self.uncertainty_mode == "credible_intervals":
             lower_bound, upper_bound, _ = redback.utils.calc_credible_intervals(samples=random_ys_list, interval=self.credible_interval_level)
             axes.fill_between(
@@ -624,14 +691,17 @@ class MagnitudePlotter(Plotter):
             random_ys_list = [self.model(times, **random_params, **self._model_kwargs)
                               for random_params in self._get_random_parameters()]
             if self.uncertainty_mode == "random_models":
-                for ys in random_ys_list:
-                    if band in self.band_scaling:
-                        if self.band_scaling.get("type") == 'x':
-                            axes.plot(times - self._reference_mjd_date, ys * self.band_scaling.get(band), color=color_sample, alpha=self.random_sample_alpha, lw=self.linewidth, zorder=-1)
-                        elif self.band_scaling.get("type") == '+':
-                            axes.plot(times - self._reference_mjd_date, ys + self.band_scaling.get(band), color=color_sample, alpha=self.random_sample_alpha, lw=self.linewidth, zorder=-1)
+                random_ys = np.array(random_ys_list)
+                if band in self.band_scaling:
+                    if self.band_scaling.get("type") == 'x':
+                        random_ys = random_ys * self.band_scaling.get(band)
+                    elif self.band_scaling.get("type") == '+':
+                        random_ys = random_ys + self.band_scaling.get(band)
                     else:
-                        axes.plot(times - self._reference_mjd_date, ys, color=color_sample, alpha=self.random_sample_alpha, lw=self.linewidth, zorder=-1)
+                        random_ys = []
+                self._plot_random_models(
+                    axes=axes, times=times - self._reference_mjd_date, random_ys=random_ys, color=color_sample,
+                    zorder=-1)
             elif self.uncertainty_mode == "credible_intervals":
                 if band in self.band_scaling:
                     if self.band_scaling.get("type") == 'x':
@@ -785,9 +855,9 @@ class MagnitudePlotter(Plotter):
             random_ys_list = [self.model(times, **random_params, **new_model_kwargs)
                               for random_params in self._get_random_parameters()]
             if self.uncertainty_mode == "random_models":
-                for random_ys in random_ys_list:
-                    axes[ii].plot(times - self._reference_mjd_date, random_ys, color=color_sample,
-                                  alpha=self.random_sample_alpha, lw=self.linewidth, zorder=self.zorder)
+                self._plot_random_models(
+                    axes=axes[ii], times=times - self._reference_mjd_date, random_ys=random_ys_list,
+                    color=color_sample, zorder=self.zorder)
             elif self.uncertainty_mode == "credible_intervals":
                 lower_bound, upper_bound, _ = redback.utils.calc_credible_intervals(samples=random_ys_list, interval=self.credible_interval_level)
                 axes[ii].fill_between(
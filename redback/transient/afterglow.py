@@ -157,6 +157,7 @@ class Afterglow(Transient):
         """
         if data_mode in self.DATA_MODES or data_mode is None:
             self._data_mode = data_mode
+            self._set_attribute_names()
             try:
                 self.directory_structure = afterglow_directory_structure(
                     grb=self.name, data_mode=self.data_mode, instrument="")
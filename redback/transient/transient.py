@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import os
 from typing import Union
 
 import matplotlib
@@ -10,6 +12,101 @@ import redback
 from redback.plotting import \
     LuminosityPlotter, FluxDensityPlotter, IntegratedFluxPlotter, MagnitudePlotter, IntegratedFluxOpticalPlotter
 
+_OPTICAL_COLUMNS = ("time (days)", "time", "magnitude", "e_magnitude", "band", "flux(erg/cm2/s)", "flux_error",
+                    "flux_density(mjy)", "flux_density_error")
+_TIME_COLUMNS = ("time (days)", "time")
+_STRING_COLUMNS = ("band", "system")
+_OPEN_ACCESS_COLUMNS = dict(
+    magnitude=("time (days)", "time", "magnitude", "e_magnitude", "band", "system"),
+    flux_density=("time (days)", "time", "flux_density(mjy)", "flux_density_error", "band", "system"),
+    flux=("time (days)", "time", "flux(erg/cm2/s)", "flux_error", "band", "system"),
+    all=("time (days)", "time", "flux_density(mjy)", "flux_density_error", "magnitude", "e_magnitude",
+         "flux(erg/cm2/s)", "flux_error", "band", "system"))
+
+FLOAT_DTYPE = np.float32
+
+
+def _columns_to_numpy(
+        df: pd.DataFrame, columns: Union[list, tuple] = _OPTICAL_COLUMNS, dtype: np.dtype = FLOAT_DTYPE,
+        copy: bool = False) -> tuple:
+    """Converts data columns to arrays. Bands and photometric systems are stored as fixed-width unicode instead of
+    objects and measurements are stored as `dtype`. Times are always kept in double precision since MJDs do not fit
+    into single precision.
+
+    :param df: DataFrame containing the columns.
+    :type df: pd.DataFrame
+    :param columns: Names of the columns to convert. Default are the optical data columns.
+    :type columns: Union[list, tuple]
+    :param dtype: Floating point type of the measurement columns. Default is `FLOAT_DTYPE`.
+    :type dtype: np.dtype, optional
+    :param copy: Whether the arrays must not share memory with `df`. Default is False.
+    :type copy: bool, optional
+    :return: One array per column.
+    :rtype: tuple
+    """
+    arrays = []
+    for column in columns:
+        if column in _STRING_COLUMNS:
+            arrays.append(df[column].astype(str).to_numpy(dtype=str))
+        elif column in _TIME_COLUMNS:
+            arrays.append(df[column].to_numpy(copy=copy))
+        else:
+            arrays.append(df[column].to_numpy(dtype=dtype, copy=copy))
+    return tuple(arrays)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_processed_file(processed_file_path: str, modification_time: int, columns: tuple) -> pd.DataFrame:
+    """Reads the given columns of a processed data file. Cached, so repeated loads of an unchanged file are not
+    parsed again. The modification time is part of the cache key so that updated files are read again.
+
+    :param processed_file_path: Path to the processed file to load.
+    :type processed_file_path: str
+    :param modification_time: Modification time of the file in nanoseconds.
+    :type modification_time: int
+    :param columns: Names of the columns to read.
+    :type columns: tuple
+    :return: The DataFrame with the requested columns. Shared between calls and should not be modified.
+    :rtype: pd.DataFrame
+    """
+    return pd.read_csv(processed_file_path, usecols=list(columns), dtype=dict(band=str, system=str), engine="c")
+
+
+def _read_event_table(event_table: str) -> pd.DataFrame:
+    """Reads a metadata table as strings, skipping bad lines. Empty fields are read as NaN.
+
+    The C engine is used on purpose. The pyarrow engine infers column types before converting to strings, so it
+    reads empty fields as 'nan'/'None' and reformats numbers such as '010'.
+
+    :param event_table: Path to the metadata table.
+    :type event_table: str
+    :return: The metadata.
+    :rtype: pd.DataFrame
+    """
+    return pd.read_csv(event_table, on_bad_lines='skip', delimiter=',', dtype='str', engine='c')
+
+
+def _inject_kwargs_doc(method: callable) -> callable:
+    """Decorator that replaces the placeholder in the docstring of a `Transient` plot method with the documentation
+    of the keyword arguments accepted by `redback.plotting.Plotter`.
+
+    :param method: The plot method.
+    :type method: callable
+    :return: The plot method with the updated docstring.
+    :rtype: callable
+    """
+    method.__doc__ = method.__doc__.replace(
+        f"`print(Transient.{method.__name__}.__doc__)` to see all options!",
+        redback.plotting.Plotter.keyword_docstring)
+    return method
+
+
+@functools.lru_cache(maxsize=64)
+def _rainbow_palette(n_colors: int) -> np.ndarray:
+    """Rainbow colors for `n_colors` filters. Cached since the palette only depends on the number of filters.
+    The returned array is shared between calls and should not be modified."""
+    return matplotlib.cm.rainbow(np.linspace(0, 1, n_colors))
+
 
 class Transient(object):
     DATA_MODES = ['luminosity', 'flux', 'flux_density', 'magnitude', 'counts', 'ttes']
@@ -128,28 +225,48 @@ class Transient(object):
         self.magnitude = magnitude
         self.magnitude_err = magnitude_err
         self.counts = counts
-        self.counts_err = np.sqrt(counts) if counts is not None else None
+        self._counts_err = None
         self.ttes = ttes
 
         self._frequency = None
         self._bands = None
+        self._bands_codes = None
+        self._bands_categories = None
+        self._filtered_indices_cache = None
+        self._list_of_band_indices_cache = None
+        self._sncosmo_bands = None
+        self._unique_bands_cache = None
+        self._unique_frequencies_cache = None
         self.set_bands_and_frequency(bands=bands, frequency=frequency)
         self.system = system
+        self._use_phase_model = use_phase_model
         self.data_mode = data_mode
         self.active_bands = active_bands
-        self.sncosmo_bands = redback.utils.sncosmo_bandname_from_band(self.bands)
         self.redshift = redshift
         self.name = name
-        self.use_phase_model = use_phase_model
         self.optical_data = optical_data
 
         self.meta_data = None
         self.photon_index = photon_index
-        self.directory_structure = redback.get_data.directory.DirectoryStructure(
-            directory_path=".", raw_file_path=".", processed_file_path=".")
+        self._directory_structure = None
+
+    @property
+    def directory_structure(self) -> redback.get_data.directory.DirectoryStructure:
+        """
+        :return: The directory structure of the transient. Defaults to the current directory if none was set.
+        :rtype: redback.get_data.directory.DirectoryStructure
+        """
+        if self._directory_structure is None:
+            self._directory_structure = redback.get_data.directory.DirectoryStructure(
+                directory_path=".", raw_file_path=".", processed_file_path=".")
+        return self._directory_structure
+
+    @directory_structure.setter
+    def directory_structure(self, directory_structure: redback.get_data.directory.DirectoryStructure) -> None:
+        self._directory_structure = directory_structure
 
     @staticmethod
-    def load_data_generic(processed_file_path, data_mode="magnitude"):
+    def load_data_generic(processed_file_path, data_mode="magnitude", dtype=FLOAT_DTYPE):
         """Loads data from specified directory and file, and returns it as a tuple.
 
         :param processed_file_path: Path to the processed file to load
@@ -157,29 +274,29 @@ class Transient(object):
         :param data_mode: Name of the data mode.
                           Must be from ['magnitude', 'flux_density', 'all']. Default is magnitude.
         :type data_mode: str, optional
+        :param dtype: Floating point type of the measurements. Use `np.float64` for double precision.
+                      Default is `FLOAT_DTYPE`.
+        :type dtype: np.dtype, optional
 
         :return: Six elements when querying magnitude or flux_density data, Eight for 'all'.
         :rtype: tuple
         """
-        df = pd.read_csv(processed_file_path)
-        time_days = np.array(df["time (days)"])
-        time_mjd = np.array(df["time"])
-        magnitude = np.array(df["magnitude"])
-        magnitude_err = np.array(df["e_magnitude"])
-        bands = np.array(df["band"])
-        flux_density = np.array(df["flux_density(mjy)"])
-        flux_density_err = np.array(df["flux_density_error"])
         if data_mode == "magnitude":
-            return time_days, time_mjd, magnitude, magnitude_err, bands
+            columns = ["time (days)", "time", "magnitude", "e_magnitude", "band"]
         elif data_mode == "flux_density":
-            return time_days, time_mjd, flux_density, flux_density_err, bands
+            columns = ["time (days)", "time", "flux_density(mjy)", "flux_density_error", "band"]
         elif data_mode == "all":
-            return time_days, time_mjd, flux_density, flux_density_err, magnitude, magnitude_err, bands
+            columns = ["time (days)", "time", "flux_density(mjy)", "flux_density_error",
+                       "magnitude", "e_magnitude", "band"]
+        else:
+            return None
+        df = pd.read_csv(processed_file_path, usecols=columns)
+        return _columns_to_numpy(df, columns, dtype=dtype)
 
     @classmethod
     def from_lasair_data(
             cls, name: str, data_mode: str = "magnitude", active_bands: Union[np.ndarray, str] = 'all',
-            use_phase_model: bool = False) -> Transient:
+            use_phase_model: bool = False, dtype: np.dtype = FLOAT_DTYPE) -> Transient:
         """Constructor method to built object from LASAIR data.
 
         :param name: Name of the transient.
@@ -191,6 +308,9 @@ class Transient(object):
         :type active_bands: Union[np.ndarray, str]
         :param use_phase_model: Whether to use a phase model.
         :type use_phase_model: bool, optional
+        :param dtype: Floating point type of the measurements. Use `np.float64` for double precision.
+                      Default is `FLOAT_DTYPE`.
+        :type dtype: np.dtype, optional
 
         :return: A class instance.
         :rtype: OpticalTransient
@@ -201,16 +321,9 @@ class Transient(object):
             transient_type = cls.__name__.lower()
         directory_structure = redback.get_data.directory.lasair_directory_structure(
             transient=name, transient_type=transient_type)
-        df = pd.read_csv(directory_structure.processed_file_path)
-        time_days = np.array(df["time (days)"])
-        time_mjd = np.array(df["time"])
-        magnitude = np.array(df["magnitude"])
-        magnitude_err = np.array(df["e_magnitude"])
-        bands = np.array(df["band"])
-        flux = np.array(df["flux(erg/cm2/s)"])
-        flux_err = np.array(df["flux_error"])
-        flux_density = np.array(df["flux_density(mjy)"])
-        flux_density_err = np.array(df["flux_density_error"])
+        df = pd.read_csv(directory_structure.processed_file_path, usecols=list(_OPTICAL_COLUMNS))
+        time_days, time_mjd, magnitude, magnitude_err, bands, flux, flux_err, flux_density, flux_density_err = \
+            _columns_to_numpy(df, dtype=dtype)
         return cls(name=name, data_mode=data_mode, time=time_days, time_err=None, time_mjd=time_mjd,
                    flux_density=flux_density, flux_density_err=flux_density_err, magnitude=magnitude,
                    magnitude_err=magnitude_err, flux=flux, flux_err=flux_err, bands=bands, active_bands=active_bands,
@@ -219,7 +332,7 @@ class Transient(object):
     @classmethod
     def from_simulated_optical_data(
             cls, name: str, data_mode: str = "magnitude", active_bands: Union[np.ndarray, str] = 'all',
-            use_phase_model: bool = False) -> Transient:
+            use_phase_model: bool = False, dtype: np.dtype = FLOAT_DTYPE) -> Transient:
         """Constructor method to built object from SimulatedOpticalTransient.
 
         :param name: Name of the transient.
@@ -231,22 +344,18 @@ class Transient(object):
         :type active_bands: Union[np.ndarray, str]
         :param use_phase_model: Whether to use a phase model.
         :type use_phase_model: bool, optional
+        :param dtype: Floating point type of the measurements. Use `np.float64` for double precision.
+                      Default is `FLOAT_DTYPE`.
+        :type dtype: np.dtype, optional
 
         :return: A class instance.
         :rtype: OpticalTransient
         """
         path = "simulated/" + name + ".csv"
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, usecols=[*_OPTICAL_COLUMNS, "detected"])
         df = df[df.detected != 0]
-        time_days = np.array(df["time (days)"])
-        time_mjd = np.array(df["time"])
-        magnitude = np.array(df["magnitude"])
-        magnitude_err = np.array(df["e_magnitude"])
-        bands = np.array(df["band"])
-        flux = np.array(df["flux(erg/cm2/s)"])
-        flux_err = np.array(df["flux_error"])
-        flux_density = np.array(df["flux_density(mjy)"])
-        flux_density_err = np.array(df["flux_density_error"])
+        time_days, time_mjd, magnitude, magnitude_err, bands, flux, flux_err, flux_density, flux_density_err = \
+            _columns_to_numpy(df, dtype=dtype)
         return cls(name=name, data_mode=data_mode, time=time_days, time_err=None, time_mjd=time_mjd,
                    flux_density=flux_density, flux_density_err=flux_density_err, magnitude=magnitude,
                    magnitude_err=magnitude_err, flux=flux, flux_err=flux_err, bands=bands, active_bands=active_bands,
@@ -272,13 +381,25 @@ class Transient(object):
     def _y_err_attribute_name(self) -> str:
         return self._ATTRIBUTE_NAME_DICT[self.data_mode] + "_err"
 
+    def _set_attribute_names(self) -> None:
+        """Resolves the attribute names behind `x`, `x_err`, `y`, and `y_err` for the active data mode
+        and phase model setting, so they do not need to be looked up again on every access."""
+        self._resolved_time_attr = self._time_attribute_name
+        self._resolved_time_err_attr = self._time_err_attribute_name
+        try:
+            self._resolved_y_attr = self._y_attribute_name
+            self._resolved_y_err_attr = self._y_err_attribute_name
+        except KeyError:
+            self._resolved_y_attr = None
+            self._resolved_y_err_attr = None
+
     @property
     def x(self) -> np.ndarray:
         """
         :return: The time values given the active data mode.
         :rtype: np.ndarray
         """
-        return getattr(self, self._time_attribute_name)
+        return getattr(self, self._resolved_time_attr)
 
     @x.setter
     def x(self, x: np.ndarray) -> None:
@@ -286,7 +407,7 @@ class Transient(object):
         :param x: The desired time values.
         :type x: np.ndarray
         """
-        setattr(self, self._time_attribute_name, x)
+        setattr(self, self._resolved_time_attr, x)
 
     @property
     def x_err(self) -> np.ndarray:
@@ -294,7 +415,7 @@ class Transient(object):
         :return: The time error values given the active data mode.
         :rtype: np.ndarray
         """
-        return getattr(self, self._time_err_attribute_name)
+        return getattr(self, self._resolved_time_err_attr)
 
     @x_err.setter
     def x_err(self, x_err: np.ndarray) -> None:
@@ -302,7 +423,7 @@ class Transient(object):
         :param x_err: The desired time error values.
         :type x_err: np.ndarray
         """
-        setattr(self, self._time_err_attribute_name, x_err)
+        setattr(self, self._resolved_time_err_attr, x_err)
 
     @property
     def y(self) -> np.ndarray:
@@ -310,8 +431,8 @@ class Transient(object):
         :return: The y values given the active data mode.
         :rtype: np.ndarray
         """
-
-        return getattr(self, self._y_attribute_name)
+        # Data modes without y values fall through to the lookup, which raises a KeyError
+        return getattr(self, self._resolved_y_attr or self._y_attribute_name)
 
     @y.setter
     def y(self, y: np.ndarray) -> None:
@@ -319,7 +440,7 @@ class Transient(object):
         :param y: The desired y values.
         :type y: np.ndarray
         """
-        setattr(self, self._y_attribute_name, y)
+        setattr(self, self._resolved_y_attr or self._y_attribute_name, y)
 
     @property
     def y_err(self) -> np.ndarray:
@@ -327,7 +448,7 @@ class Transient(object):
         :return: The y error values given the active data mode.
         :rtype: np.ndarray
         """
-        return getattr(self, self._y_err_attribute_name)
+        return getattr(self, self._resolved_y_err_attr or self._y_err_attribute_name)
 
     @y_err.setter
     def y_err(self, y_err: np.ndarray) -> None:
@@ -335,7 +456,27 @@ class Transient(object):
         :param y_err: The desired y error values.
         :type y_err: np.ndarray
         """
-        setattr(self, self._y_err_attribute_name, y_err)
+        setattr(self, self._resolved_y_err_attr or self._y_err_attribute_name, y_err)
+
+    @property
+    def counts_err(self) -> Union[np.ndarray, None]:
+        """
+        :return: The count errors. Poisson errors are derived from the counts on first access if none were set.
+        :rtype: Union[np.ndarray, None]
+        """
+        if self._counts_err is None and self.counts is not None:
+            counts = np.asarray(self.counts)
+            self._counts_err = np.empty(counts.shape, dtype=np.float64)
+            np.sqrt(counts, out=self._counts_err)
+        return self._counts_err
+
+    @counts_err.setter
+    def counts_err(self, counts_err: np.ndarray) -> None:
+        """
+        :param counts_err: The desired count errors.
+        :type counts_err: np.ndarray
+        """
+        self._counts_err = counts_err
 
     @property
     def data_mode(self) -> str:
@@ -353,9 +494,27 @@ class Transient(object):
         """
         if data_mode in self.DATA_MODES or data_mode is None:
             self._data_mode = data_mode
+            self._set_attribute_names()
         else:
             raise ValueError("Unknown data mode.")
 
+    @property
+    def use_phase_model(self) -> bool:
+        """
+        :return: Whether we are using a phase model.
+        :rtype: bool
+        """
+        return self._use_phase_model
+
+    @use_phase_model.setter
+    def use_phase_model(self, use_phase_model: bool) -> None:
+        """
+        :param use_phase_model: Whether we are using a phase model.
+        :type use_phase_model: bool
+        """
+        self._use_phase_model = use_phase_model
+        self._set_attribute_names()
+
     @property
     def xlabel(self) -> str:
         """
@@ -389,6 +548,13 @@ class Transient(object):
         :param frequency: The frequencies associated with the bands i.e., the effective frequency.
         :type frequency: Union[None, list, np.ndarray]
         """
+        self._filtered_indices_cache = None
+        self._list_of_band_indices_cache = None
+        self._sncosmo_bands = None
+        self._unique_bands_cache = None
+        self._unique_frequencies_cache = None
+        if bands is not None:
+            bands = np.ascontiguousarray(bands)
         if (bands is None and frequency is None) or (bands is not None and frequency is not None):
             self._bands = bands
             self._frequency = frequency
@@ -398,6 +564,17 @@ class Transient(object):
         elif bands is not None and frequency is None:
             self._bands = bands
             self._frequency = self.bands_to_frequency(self.bands)
+        self._set_band_codes()
+
+    def _set_band_codes(self) -> None:
+        """Encodes `bands` as integer category codes so filtering by active bands is done on small integers."""
+        if self._bands is None:
+            self._bands_codes = None
+            self._bands_categories = None
+        else:
+            categorical = pd.Categorical(np.ravel(self._bands))
+            self._bands_codes = categorical.codes
+            self._bands_categories = categorical.categories
 
     @property
     def frequency(self) -> np.ndarray:
@@ -423,6 +600,20 @@ class Transient(object):
     def bands(self, bands: Union[list, None, np.ndarray]):
         self.set_bands_and_frequency(bands=bands, frequency=self.frequency)
 
+    @property
+    def sncosmo_bands(self) -> np.ndarray:
+        """
+        :return: The sncosmo band names associated with `bands`. Only converted when first requested.
+        :rtype: np.ndarray
+        """
+        if self._sncosmo_bands is None:
+            self._sncosmo_bands = redback.utils.sncosmo_bandname_from_band(self.bands)
+        return self._sncosmo_bands
+
+    @sncosmo_bands.setter
+    def sncosmo_bands(self, sncosmo_bands: np.ndarray) -> None:
+        self._sncosmo_bands = sncosmo_bands
+
     @property
     def filtered_frequencies(self) -> np.array:
         """
@@ -466,30 +657,43 @@ class Transient(object):
             self._active_bands = list(np.unique(self.bands))
         else:
             self._active_bands = active_bands
+        self._filtered_indices_cache = None
 
     @property
-    def filtered_indices(self) -> Union[list, None]:
+    def filtered_indices(self) -> Union[np.ndarray, slice]:
         """
-        :return: The list indices in `bands` associated with the active bands.
-        :rtype: Union[list, None]
+        :return: Boolean mask of the data points in `bands` associated with the active bands.
+                 Cached until bands or active bands change.
+                 If there are no bands, a slice over all data points is returned so indexing gives views.
+        :rtype: Union[np.ndarray, slice]
         """
         if self.bands is None:
-            return list(np.arange(len(self.x)))
-        return [b in self.active_bands for b in self.bands]
+            return slice(None)
+        if self._filtered_indices_cache is None:
+            if self._active_bands is None:
+                active_bands = []
+            else:
+                # object dtype so that mixed string and numeric band names are not converted to strings
+                active_bands = np.atleast_1d(np.asarray(self._active_bands, dtype=object))
+            active_codes = np.flatnonzero(self._bands_categories.isin(active_bands))
+            self._filtered_indices_cache = np.isin(self._bands_codes, active_codes)
+        return self._filtered_indices_cache
 
     def get_filtered_data(self) -> tuple:
         """Used to filter flux density, photometry or integrated flux data, so we only use data that is using the active bands.
         :return: A tuple with the filtered data. Format is (x, x_err, y, y_err)
         :rtype: tuple
         """
-        if any([self.flux_data, self.magnitude_data, self.flux_density_data]):
-            filtered_x = self.x[self.filtered_indices]
+        if self.data_mode in ("flux", "magnitude", "flux_density"):
+            indices = self.filtered_indices
+            x_err = getattr(self, self._resolved_time_err_attr)
+            filtered_x = getattr(self, self._resolved_time_attr)[indices]
             try:
-                filtered_x_err = self.x_err[self.filtered_indices]
+                filtered_x_err = None if x_err is None else x_err[indices]
             except (IndexError, TypeError):
                 filtered_x_err = None
-            filtered_y = self.y[self.filtered_indices]
-            filtered_y_err = self.y_err[self.filtered_indices]
+            filtered_y = getattr(self, self._resolved_y_attr)[indices]
+            filtered_y_err = getattr(self, self._resolved_y_err_attr)[indices]
             return filtered_x, filtered_x_err, filtered_y, filtered_y_err
         else:
             raise ValueError(f"Transient needs to be in flux density, magnitude or flux data mode, "
@@ -501,7 +705,9 @@ class Transient(object):
         :return: All bands that we get from the data, eliminating all duplicates.
         :rtype: np.ndarray
         """
-        return np.unique(self.bands)
+        if self._unique_bands_cache is None:
+            self._unique_bands_cache = np.unique(self.bands)
+        return self._unique_bands_cache
 
     @property
     def unique_frequencies(self) -> np.ndarray:
@@ -509,12 +715,14 @@ class Transient(object):
         :return: All frequencies that we get from the data, eliminating all duplicates.
         :rtype: np.ndarray
         """
-        try:
-            if isinstance(self.unique_bands[0], (float, int)):
-                return self.unique_bands
-        except (TypeError, IndexError):
-            pass
-        return self.bands_to_frequency(self.unique_bands)
+        if self._unique_frequencies_cache is None:
+            try:
+                if isinstance(self.unique_bands[0], (float, int)):
+                    return self.unique_bands
+            except (TypeError, IndexError):
+                pass
+            self._unique_frequencies_cache = self.bands_to_frequency(self.unique_bands)
+        return self._unique_frequencies_cache
 
     @property
     def list_of_band_indices(self) -> list:
@@ -522,7 +730,12 @@ class Transient(object):
         :return: Indices that map between bands in the data and the unique bands we obtain.
         :rtype: list
         """
-        return [np.where(self.bands == np.array(b))[0] for b in self.unique_bands]
+        if self._list_of_band_indices_cache is None:
+            order = np.argsort(self._bands_codes, kind="stable")
+            boundaries = np.searchsorted(self._bands_codes[order], np.arange(len(self._bands_categories) + 1))
+            self._list_of_band_indices_cache = \
+                [order[start:stop] for start, stop in zip(boundaries[:-1], boundaries[1:])]
+        return self._list_of_band_indices_cache
 
     @property
     def default_filters(self) -> list:
@@ -540,8 +753,40 @@ class Transient(object):
         :return: Colormap with one color for each filter.
         :rtype: matplotlib.colors.Colormap
         """
-        return matplotlib.cm.rainbow(np.linspace(0, 1, len(filters)))
-
+        return _rainbow_palette(len(filters))
+
+    # Plotter classes keyed by (data_mode, optical_data, plot kind)
+    _PLOTTER_TABLE = {
+        ("flux", True, "single"): IntegratedFluxOpticalPlotter,
+        ("flux", False, "single"): IntegratedFluxPlotter,
+        ("luminosity", True, "single"): LuminosityPlotter,
+        ("luminosity", False, "single"): LuminosityPlotter,
+        ("flux_density", True, "single"): FluxDensityPlotter,
+        ("flux_density", False, "single"): FluxDensityPlotter,
+        ("magnitude", True, "single"): MagnitudePlotter,
+        ("magnitude", False, "single"): MagnitudePlotter,
+        ("flux", True, "multiband"): IntegratedFluxOpticalPlotter,
+        ("flux", False, "multiband"): IntegratedFluxOpticalPlotter,
+        ("flux_density", True, "multiband"): FluxDensityPlotter,
+        ("flux_density", False, "multiband"): FluxDensityPlotter,
+        ("magnitude", True, "multiband"): MagnitudePlotter,
+        ("magnitude", False, "multiband"): MagnitudePlotter,
+        ("flux", True, "residual"): IntegratedFluxPlotter,
+        ("flux", False, "residual"): IntegratedFluxPlotter,
+        ("luminosity", True, "residual"): LuminosityPlotter,
+        ("luminosity", False, "residual"): LuminosityPlotter,
+    }
+
+    def _get_plotter_class(self, plot_kind: str) -> Union[type, None]:
+        """
+        :param plot_kind: Kind of plot, must be from ['single', 'multiband', 'residual'].
+        :type plot_kind: str
+        :return: The plotter class for the current data mode or None if the data mode can not be plotted this way.
+        :rtype: Union[type, None]
+        """
+        return self._PLOTTER_TABLE.get((self.data_mode, bool(self.optical_data), plot_kind))
+
+    @_inject_kwargs_doc
     def plot_data(self, axes: matplotlib.axes.Axes = None, filename: str = None, outdir: str = None, save: bool = True,
             show: bool = True, plot_others: bool = True, color: str = 'k', **kwargs) -> matplotlib.axes.Axes:
         """Plots the Transient data and returns Axes.
@@ -558,25 +803,14 @@ class Transient(object):
         `print(Transient.plot_data.__doc__)` to see all options!
         :return: The axes with the plot.
         """
-
-        if self.flux_data:
-            if self.optical_data:
-                plotter = IntegratedFluxOpticalPlotter(transient=self, color=color, filename=filename, outdir=outdir,
-                                       plot_others=plot_others, **kwargs)
-            else:
-                plotter = IntegratedFluxPlotter(transient=self, color=color, filename=filename, outdir=outdir, **kwargs)
-        elif self.luminosity_data:
-            plotter = LuminosityPlotter(transient=self, color=color, filename=filename, outdir=outdir, **kwargs)
-        elif self.flux_density_data:
-            plotter = FluxDensityPlotter(transient=self, color=color, filename=filename, outdir=outdir,
-                                         plot_others=plot_others, **kwargs)
-        elif self.magnitude_data:
-            plotter = MagnitudePlotter(transient=self, color=color, filename=filename, outdir=outdir,
-                                       plot_others=plot_others, **kwargs)
-        else:
+        plotter_class = self._get_plotter_class("single")
+        if plotter_class is None:
             return axes
+        plotter = plotter_class(transient=self, color=color, filename=filename, outdir=outdir,
+                                plot_others=plot_others, **kwargs)
         return plotter.plot_data(axes=axes, save=save, show=show)
 
+    @_inject_kwargs_doc
     def plot_multiband(
             self, figure: matplotlib.figure.Figure = None, axes: matplotlib.axes.Axes = None, filename: str = None,
             outdir: str = None, ncols: int = 2, save: bool = True, show: bool = True,
@@ -602,19 +836,14 @@ class Transient(object):
         if self.data_mode not in ['flux_density', 'magnitude', 'flux']:
             raise ValueError(
                 f'You cannot plot multiband data with {self.data_mode} data mode . Why are you doing this?')
-        if self.magnitude_data:
-            plotter = MagnitudePlotter(transient=self, filters=filters, filename=filename, outdir=outdir, nrows=nrows,
-                                       ncols=ncols, figsize=figsize, **kwargs)
-        elif self.flux_density_data:
-            plotter = FluxDensityPlotter(transient=self, filters=filters, filename=filename, outdir=outdir, nrows=nrows,
-                                         ncols=ncols, figsize=figsize, **kwargs)
-        elif self.flux_data:
-            plotter = IntegratedFluxOpticalPlotter(transient=self, filters=filters, filename=filename, outdir=outdir,
-                                                   nrows=nrows, ncols=ncols, figsize=figsize, **kwargs)
-        else:
+        plotter_class = self._get_plotter_class("multiband")
+        if plotter_class is None:
             return
+        plotter = plotter_class(transient=self, filters=filters, filename=filename, outdir=outdir, nrows=nrows,
+                                ncols=ncols, figsize=figsize, **kwargs)
         return plotter.plot_multiband(figure=figure, axes=axes, save=save, show=show)
 
+    @_inject_kwargs_doc
     def plot_lightcurve(
             self, model: callable, filename: str = None, outdir: str = None, axes: matplotlib.axes.Axes = None,
             save: bool = True, show: bool = True, random_models: int = 100, posterior: pd.DataFrame = None,
@@ -635,31 +864,15 @@ class Transient(object):
         `print(Transient.plot_lightcurve.__doc__)` to see all options!
         :return: The axes.
         """
-        if self.flux_data:
-            if self.optical_data:
-                plotter = IntegratedFluxOpticalPlotter(
-                    transient=self, model=model, filename=filename, outdir=outdir,
-                    posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
-            else:
-                plotter = IntegratedFluxPlotter(
-                    transient=self, model=model, filename=filename, outdir=outdir,
-                    posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
-        elif self.luminosity_data:
-            plotter = LuminosityPlotter(
-                transient=self, model=model, filename=filename, outdir=outdir,
-                posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
-        elif self.flux_density_data:
-            plotter = FluxDensityPlotter(
-                transient=self, model=model, filename=filename, outdir=outdir,
-                posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
-        elif self.magnitude_data:
-            plotter = MagnitudePlotter(
-                transient=self, model=model, filename=filename, outdir=outdir,
-                posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
-        else:
+        plotter_class = self._get_plotter_class("single")
+        if plotter_class is None:
             return axes
+        plotter = plotter_class(
+            transient=self, model=model, filename=filename, outdir=outdir,
+            posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
         return plotter.plot_lightcurve(axes=axes, save=save, show=show)
 
+    @_inject_kwargs_doc
     def plot_residual(self, model: callable, filename: str = None, outdir: str = None, axes: matplotlib.axes.Axes = None,
                       save: bool = True, show: bool = True, posterior: pd.DataFrame = None,
                       model_kwargs: dict = None, **kwargs: None) -> matplotlib.axes.Axes:
@@ -678,18 +891,14 @@ class Transient(object):
         `print(Transient.plot_residual.__doc__)` to see all options!
         :return: The axes.
         """
-        if self.flux_data:
-            plotter = IntegratedFluxPlotter(
-                transient=self, model=model, filename=filename, outdir=outdir,
-                posterior=posterior, model_kwargs=model_kwargs, **kwargs)
-        elif self.luminosity_data:
-            plotter = LuminosityPlotter(
-                transient=self, model=model, filename=filename, outdir=outdir,
-                posterior=posterior, model_kwargs=model_kwargs, **kwargs)
-        else:
-            raise ValueError("Residual plotting not implemented for this data mode")
+        if self.data_mode not in ['flux', 'luminosity']:
+            raise ValueError(f"Residual plotting not implemented for {self.data_mode} data mode")
+        plotter = self._get_plotter_class("residual")(
+            transient=self, model=model, filename=filename, outdir=outdir,
+            posterior=posterior, model_kwargs=model_kwargs, **kwargs)
         return plotter.plot_residuals(axes=axes, save=save, show=show)
 
+    @_inject_kwargs_doc
     def plot_multiband_lightcurve(
             self, model: callable, filename: str = None, outdir: str = None,
             figure: matplotlib.figure.Figure = None, axes: matplotlib.axes.Axes = None,
@@ -716,39 +925,20 @@ class Transient(object):
         if self.data_mode not in ['flux_density', 'magnitude', 'flux']:
             raise ValueError(
                 f'You cannot plot multiband data with {self.data_mode} data mode . Why are you doing this?')
-        if self.magnitude_data:
-            plotter = MagnitudePlotter(
-                transient=self, model=model, filename=filename, outdir=outdir,
-                posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
-        elif self.flux_data:
-            plotter = IntegratedFluxOpticalPlotter(transient=self, model=model, filename=filename, outdir=outdir,
-                posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
-        elif self.flux_density_data:
-            plotter = FluxDensityPlotter(
-                transient=self, model=model, filename=filename, outdir=outdir,
-                posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
-        else:
+        plotter_class = self._get_plotter_class("multiband")
+        if plotter_class is None:
             return
+        plotter = plotter_class(
+            transient=self, model=model, filename=filename, outdir=outdir,
+            posterior=posterior, model_kwargs=model_kwargs, random_models=random_models, **kwargs)
         return plotter.plot_multiband_lightcurve(figure=figure, axes=axes, save=save, show=show)
 
-    _formatted_kwargs_options = redback.plotting.Plotter.keyword_docstring
-    plot_data.__doc__ = plot_data.__doc__.replace(
-        "`print(Transient.plot_data.__doc__)` to see all options!", _formatted_kwargs_options)
-    plot_multiband.__doc__ = plot_multiband.__doc__.replace(
-        "`print(Transient.plot_multiband.__doc__)` to see all options!", _formatted_kwargs_options)
-    plot_lightcurve.__doc__ = plot_lightcurve.__doc__.replace(
-        "`print(Transient.plot_lightcurve.__doc__)` to see all options!", _formatted_kwargs_options)
-    plot_multiband_lightcurve.__doc__ = plot_multiband_lightcurve.__doc__.replace(
-        "`print(Transient.plot_multiband_lightcurve.__doc__)` to see all options!", _formatted_kwargs_options)
-    plot_residual.__doc__ = plot_residual.__doc__.replace(
-        "`print(Transient.plot_residual.__doc__)` to see all options!", _formatted_kwargs_options)
-
 
 class OpticalTransient(Transient):
     DATA_MODES = ['flux', 'flux_density', 'magnitude', 'luminosity']
 
     @staticmethod
-    def load_data(processed_file_path, data_mode="magnitude"):
+    def load_data(processed_file_path, data_mode="magnitude", dtype=FLOAT_DTYPE):
         """Loads data from specified directory and file, and returns it as a tuple.
 
         :param processed_file_path: Path to the processed file to load
@@ -756,30 +946,19 @@ class OpticalTransient(Transient):
         :param data_mode: Name of the data mode.
                           Must be from ['magnitude', 'flux_density', 'all']. Default is magnitude.
         :type data_mode: str, optional
+        :param dtype: Floating point type of the measurements. Use `np.float64` for double precision.
+                      Default is `FLOAT_DTYPE`.
+        :type dtype: np.dtype, optional
 
         :return: Six elements when querying magnitude or flux_density data, Eight for 'all'
         :rtype: tuple
         """
-        df = pd.read_csv(processed_file_path)
-        time_days = np.array(df["time (days)"])
-        time_mjd = np.array(df["time"])
-        magnitude = np.array(df["magnitude"])
-        magnitude_err = np.array(df["e_magnitude"])
-        bands = np.array(df["band"])
-        system = np.array(df["system"])
-        flux_density = np.array(df["flux_density(mjy)"])
-        flux_density_err = np.array(df["flux_density_error"])
-        flux = np.array(df["flux(erg/cm2/s)"])
-        flux_err = np.array(df['flux_error'])
-        if data_mode == "magnitude":
-            return time_days, time_mjd, magnitude, magnitude_err, bands, system
-        elif data_mode == "flux_density":
-            return time_days, time_mjd, flux_density, flux_density_err, bands, system
-        elif data_mode == "flux":
-            return time_days, time_mjd, flux, flux_err, bands, system
-        elif data_mode == "all":
-            return time_days, time_mjd, flux_density, flux_density_err, \
-                   magnitude, magnitude_err, flux, flux_err, bands, system
+        columns = _OPEN_ACCESS_COLUMNS.get(data_mode)
+        if columns is None:
+            return None
+        df = _read_processed_file(processed_file_path, os.stat(processed_file_path).st_mtime_ns, columns)
+        # copy so that changes to the data of a transient do not leak into the cached DataFrame
+        return _columns_to_numpy(df, columns, dtype=dtype, copy=True)
 
     def __init__(
             self, name: str, data_mode: str = 'magnitude', time: np.ndarray = None, time_err: np.ndarray = None,
@@ -857,12 +1036,11 @@ class OpticalTransient(Transient):
                          magnitude_err=magnitude_err, data_mode=data_mode, name=name,
                          use_phase_model=use_phase_model, optical_data=optical_data, system=system, bands=bands,
                          active_bands=active_bands, **kwargs)
-        self.directory_structure = None
 
     @classmethod
     def from_open_access_catalogue(
             cls, name: str, data_mode: str = "magnitude", active_bands: Union[np.ndarray, str] = 'all',
-            use_phase_model: bool = False) -> OpticalTransient:
+            use_phase_model: bool = False, dtype: np.dtype = FLOAT_DTYPE) -> OpticalTransient:
         """Constructor method to built object from Open Access Catalogue
 
         :param name: Name of the transient.
@@ -875,6 +1053,9 @@ class OpticalTransient(Transient):
         :type active_bands: Union[np.ndarray, str]
         :param use_phase_model: Whether to use a phase model.
         :type use_phase_model: bool, optional
+        :param dtype: Floating point type of the measurements. Use `np.float64` for double precision.
+                      Default is `FLOAT_DTYPE`.
+        :type dtype: np.dtype, optional
 
         :return: A class instance
         :rtype: OpticalTransient
@@ -886,11 +1067,13 @@ class OpticalTransient(Transient):
         directory_structure = redback.get_data.directory.open_access_directory_structure(
             transient=name, transient_type=transient_type)
         time_days, time_mjd, flux_density, flux_density_err, magnitude, magnitude_err, flux, flux_err, bands, system = \
-            cls.load_data(processed_file_path=directory_structure.processed_file_path, data_mode="all")
-        return cls(name=name, data_mode=data_mode, time=time_days, time_err=None, time_mjd=time_mjd,
-                   flux_density=flux_density, flux_density_err=flux_density_err, magnitude=magnitude,
-                   magnitude_err=magnitude_err, bands=bands, system=system, active_bands=active_bands,
-                   use_phase_model=use_phase_model, optical_data=True, flux=flux, flux_err=flux_err)
+            cls.load_data(processed_file_path=directory_structure.processed_file_path, data_mode="all", dtype=dtype)
+        transient = cls(name=name, data_mode=data_mode, time=time_days, time_err=None, time_mjd=time_mjd,
+                        flux_density=flux_density, flux_density_err=flux_density_err, magnitude=magnitude,
+                        magnitude_err=magnitude_err, bands=bands, system=system, active_bands=active_bands,
+                        use_phase_model=use_phase_model, optical_data=True, flux=flux, flux_err=flux_err)
+        transient.directory_structure = directory_structure
+        return transient
 
     @property
     def event_table(self) -> str:
@@ -903,7 +1086,7 @@ class OpticalTransient(Transient):
     def _set_data(self) -> None:
         """Sets the metadata from the event table."""
         try:
-            meta_data = pd.read_csv(self.event_table, on_bad_lines='skip', delimiter=',', dtype='str')
+            meta_data = _read_event_table(self.event_table)
         except FileNotFoundError as e:
             redback.utils.logger.warning(e)
             redback.utils.logger.warning("Setting metadata to None. This is not an error, but a warning that no metadata could be found online.")
@@ -168,7 +168,7 @@ def _comoving_blackbody_to_flux_density(dl, frequency, radius, temperature, dopp
     boltzmann_constant = cc.k_B.cgs
     num = 2 * np.pi * planck * frequency ** 3 * radius ** 2
     denom = dl ** 2 * speed_of_light ** 2 * doppler_factor ** 2
-    frac = 1. / (np.exp((planck * frequency) / (boltzmann_constant * temperature * doppler_factor)) - 1)
+    frac = 1. / np.expm1((planck * frequency) / (boltzmann_constant * temperature * doppler_factor))
     flux_density = num / denom * frac
     return flux_density
 
@@ -190,7 +190,7 @@ def _comoving_blackbody_to_luminosity(frequency, radius, temperature, doppler_fa
     boltzmann_constant = cc.k_B.cgs
     num = 8 * np.pi ** 2 * planck * frequency ** 4 * radius ** 2
     denom = speed_of_light ** 2 * doppler_factor ** 2
-    frac = 1. / (np.exp((planck * frequency) / (boltzmann_constant * temperature * doppler_factor)) - 1)
+    frac = 1. / np.expm1((planck * frequency) / (boltzmann_constant * temperature * doppler_factor))
     luminosity = num / denom * frac
     return luminosity
 
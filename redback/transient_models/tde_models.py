@@ -35,7 +35,7 @@ def _cooling_envelope(mbh_6, stellar_mass, eta, alpha, beta, **kwargs):
     :param eta: SMBH feedback efficiency (typical range: etamin - 0.1)
     :param alpha: disk viscosity
     :param beta: TDE penetration factor (typical range: 1 - beta_max)
-    :param kwargs:
+    :param kwargs: nulnu_frequency: frequency in Hz at which nulnu is computed, default is 6e14
     :return: named tuple with bolometric luminosity, photosphere radius, temperature, and other parameters
     """
     t_0_init = kwargs.get('t_0_init', 1.0)
@@ -161,8 +161,8 @@ def _cooling_envelope(mbh_6, stellar_mass, eta, alpha, beta, **kwargs):
         constraint_2 = len(time_temp)
     constraint = np.min([constraint_1, constraint_2])
     termination_time_id = np.min([constraint_1, constraint_2])
-    nu = 6.0e14
-    expon = 1. / (np.exp(cc.planck * nu / (cc.boltzmann_constant * Teff)) - 1.0)
+    nu = kwargs.get('nulnu_frequency', 6.0e14)
+    expon = 1. / np.expm1(cc.planck * nu / (cc.boltzmann_constant * Teff))
     nuLnu40 = (8.0*np.pi ** (2.0) * Rph ** (2.0) / cc.speed_of_light ** (2.0))
     nuLnu40 = nuLnu40 * ((cc.planck * nu) * (nu ** (2.0))) / 1.0e30
     nuLnu40 = nuLnu40 * expon
@@ -1,4 +1,5 @@
 import contextlib
+import functools
 import logging
 import os
 from collections import namedtuple
@@ -44,6 +45,36 @@ def download_pointing_tables():
     """
     return logger.info("Pointing tables downloaded and stored in redback/tables")
 
+@functools.lru_cache(maxsize=32)
+def _filters_table_mapping(key_column, value_column, modification_time):
+    """
+    Reads a mapping between two columns of the filters table. Cached, the modification time is part of the key
+    so that filters added to the table are picked up.
+
+    :param key_column: Column of the filters table used as keys.
+    :param value_column: Column of the filters table used as values.
+    :param modification_time: Modification time of the filters table.
+    :return: Dictionary mapping between the two columns. Shared between calls and should not be modified.
+    """
+    df = pd.read_csv(f"{dirname}/tables/filters.csv")
+    return dict(zip(df[key_column], df[value_column]))
+
+
+def get_filters_table_mapping(key_column, value_column):
+    """
+    Mapping between two columns of the filters table, e.g. from band names to frequencies.
+
+    :param key_column: Column of the filters table used as keys.
+    :type key_column: str
+    :param value_column: Column of the filters table used as values.
+    :type value_column: str
+    :return: Dictionary mapping between the two columns.
+    :rtype: dict
+    """
+    modification_time = os.stat(f"{dirname}/tables/filters.csv").st_mtime_ns
+    return _filters_table_mapping(key_column, value_column, modification_time)
+
+
 def sncosmo_bandname_from_band(bands, warning_style='softest'):
     """
     Convert redback data band names to sncosmo compatible band names
@@ -58,8 +89,7 @@ def sncosmo_bandname_from_band(bands, warning_style='softest'):
         bands = []
     if isinstance(bands, str):
         bands = [bands]
-    df = pd.read_csv(f"{dirname}/tables/filters.csv")
-    bands_to_flux = {band: wavelength for band, wavelength in zip(df['bands'], df['sncosmo_name'])}
+    bands_to_flux = get_filters_table_mapping('bands', 'sncosmo_name')
     res = []
     for band in bands:
         try:
@@ -493,8 +523,7 @@ def bands_to_reference_flux(bands):
         bands = []
     if isinstance(bands, str):
         bands = [bands]
-    df = pd.read_csv(f"{dirname}/tables/filters.csv")
-    bands_to_flux = {band: wavelength for band, wavelength in zip(df['bands'], df['reference_flux'])}
+    bands_to_flux = get_filters_table_mapping('bands', 'reference_flux')
     res = []
     for band in bands:
         try:
@@ -516,8 +545,7 @@ def bands_to_frequency(bands):
     """
     if bands is None:
         bands = []
-    df = pd.read_csv(f"{dirname}/tables/filters.csv")
-    bands_to_freqs = {band: wavelength for band, wavelength in zip(df['bands'], df['wavelength [Hz]'])}
+    bands_to_freqs = get_filters_table_mapping('bands', 'wavelength [Hz]')
     res = []
     for band in bands:
         try:
@@ -538,8 +566,7 @@ def frequency_to_bandname(frequency):
     """
     if frequency is None:
         frequency = []
-    df = pd.read_csv(f"{dirname}/tables/filters.csv")
-    freqs_to_bands = {wavelength: band for wavelength, band in zip(df['wavelength [Hz]'], df['bands'])}
+    freqs_to_bands = get_filters_table_mapping('wavelength [Hz]', 'bands')
     res = []
     for freq in frequency:
         try:
@@ -639,7 +666,7 @@ def bin_ttes(ttes, bin_size):
     :return: times and counts in bins
     """
     counts, bin_edges = np.histogram(ttes, np.arange(ttes[0], ttes[-1], bin_size))
-    times = np.array([bin_edges[i] + (bin_edges[i + 1] - bin_edges[i]) / 2 for i in range(len(bin_edges) - 1)])
+    times = bin_edges[:-1] + np.diff(bin_edges) / 2
     return times, counts
 
 
@@ -398,3 +398,81 @@ class TestThinShellExpansion(unittest.TestCase):
         ys = function(self.time, **prior.sample(), **kwargs)
         self.assertEqual(len(self.time), len(ys))
 
+
+class TestComovingBlackbody(unittest.TestCase):
+    def setUp(self):
+        self.frequency = np.array([1e9, 1e13, 1e15])
+        self.rayleigh_jeans_frequency = np.array([1e3, 1e4])
+        self.radius = 1e14
+        self.temperature = 1e4
+        self.doppler_factor = 1.2
+        self.dl = 1e27
+
+    def tearDown(self) -> None:
+        pass
+
+    def get_x(self, frequency):
+        return redback.constants.planck * frequency / (
+                redback.constants.boltzmann_constant * self.temperature * self.doppler_factor)
+
+    def get_flux_density(self, frequency):
+        return redback.transient_models.magnetar_driven_ejecta_models._comoving_blackbody_to_flux_density(
+            dl=self.dl, frequency=frequency, radius=self.radius, temperature=self.temperature,
+            doppler_factor=self.doppler_factor).value
+
+    def get_luminosity(self, frequency):
+        return redback.transient_models.magnetar_driven_ejecta_models._comoving_blackbody_to_luminosity(
+            frequency=frequency, radius=self.radius, temperature=self.temperature,
+            doppler_factor=self.doppler_factor).value
+
+    def flux_density_prefactor(self, frequency):
+        return 2 * np.pi * redback.constants.planck * frequency ** 3 * self.radius ** 2 / (
+                self.dl ** 2 * redback.constants.speed_of_light ** 2 * self.doppler_factor ** 2)
+
+    def luminosity_prefactor(self, frequency):
+        return 8 * np.pi ** 2 * redback.constants.planck * frequency ** 4 * self.radius ** 2 / (
+                redback.constants.speed_of_light ** 2 * self.doppler_factor ** 2)
+
+    def test_flux_density(self):
+        expected = self.flux_density_prefactor(self.frequency) / (np.exp(self.get_x(self.frequency)) - 1)
+        self.assertTrue(np.allclose(expected, self.get_flux_density(self.frequency), rtol=1e-6))
+
+    def test_luminosity(self):
+        expected = self.luminosity_prefactor(self.frequency) / (np.exp(self.get_x(self.frequency)) - 1)
+        self.assertTrue(np.allclose(expected, self.get_luminosity(self.frequency), rtol=1e-6))
+
+    def test_flux_density_rayleigh_jeans_limit(self):
+        frequency = self.rayleigh_jeans_frequency
+        expected = self.flux_density_prefactor(frequency) / self.get_x(frequency)
+        self.assertTrue(np.allclose(expected, self.get_flux_density(frequency), rtol=1e-9, atol=0))
+
+    def test_luminosity_rayleigh_jeans_limit(self):
+        frequency = self.rayleigh_jeans_frequency
+        expected = self.luminosity_prefactor(frequency) / self.get_x(frequency)
+        self.assertTrue(np.allclose(expected, self.get_luminosity(frequency), rtol=1e-9, atol=0))
+
+
+class TestCoolingEnvelopeNuLnu(unittest.TestCase):
+    def setUp(self):
+        self.parameters = dict(mbh_6=1.0, stellar_mass=1.0, eta=0.1, alpha=0.1, beta=0.9)
+
+    def tearDown(self) -> None:
+        pass
+
+    def test_rayleigh_jeans_limit(self):
+        frequency = 1e3
+        output = redback.transient_models.tde_models._cooling_envelope(
+            **self.parameters, nulnu_frequency=frequency)
+        expected = 8 * np.pi ** 2 * output.photosphere_radius ** 2 * frequency ** 3 * \
+            redback.constants.boltzmann_constant * output.photosphere_temperature / \
+            redback.constants.speed_of_light ** 2
+        self.assertTrue(np.allclose(expected, output.nulnu, rtol=1e-9, atol=0))
+
+    def test_default_frequency(self):
+        output = redback.transient_models.tde_models._cooling_envelope(**self.parameters)
+        frequency = 6e14
+        x = redback.constants.planck * frequency / (
+                redback.constants.boltzmann_constant * output.photosphere_temperature)
+        expected = 8 * np.pi ** 2 * output.photosphere_radius ** 2 * redback.constants.planck * frequency ** 4 / (
+                redback.constants.speed_of_light ** 2 * (np.exp(x) - 1))
+        self.assertTrue(np.allclose(expected, output.nulnu, rtol=1e-6))
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.collections
+import matplotlib.pyplot as plt
+import numpy as np
+
+import redback
+
+
+class TestPlotterSave(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rc_params = mock.patch.dict(matplotlib.rcParams, {"text.usetex": False})
+        rc_params.start()
+        self.addCleanup(rc_params.stop)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.figure = plt.figure()
+        plt.plot([1, 2, 3], [3, 1, 2])
+
+    def tearDown(self) -> None:
+        plt.close(self.figure)
+        self.tmpdir.cleanup()
+        del self.tmpdir
+        del self.figure
+
+    def _save(self, filename: str, **kwargs) -> None:
+        plotter = redback.plotting.Plotter(transient=None, dpi=50, **kwargs)
+        plotter._save_and_show(filepath=os.path.join(self.tmpdir.name, filename), save=True, show=False)
+
+    def test_buffered_save_same_file_with_extension(self):
+        self._save("unbuffered.png", buffered_save=False)
+        self._save("buffered.png", buffered_save=True)
+        with open(os.path.join(self.tmpdir.name, "unbuffered.png"), "rb") as f:
+            unbuffered = f.read()
+        with open(os.path.join(self.tmpdir.name, "buffered.png"), "rb") as f:
+            buffered = f.read()
+        self.assertEqual(unbuffered, buffered)
+
+    def test_buffered_save_same_file_without_extension(self):
+        with matplotlib.rc_context({"savefig.format": "pdf"}):
+            self._save("unbuffered", buffered_save=False)
+            self._save("buffered", buffered_save=True)
+        self.assertListEqual(["buffered.pdf", "unbuffered.pdf"], sorted(os.listdir(self.tmpdir.name)))
+        for filename in ["buffered.pdf", "unbuffered.pdf"]:
+            with open(os.path.join(self.tmpdir.name, filename), "rb") as f:
+                self.assertEqual(b"%PDF", f.read(4))
+
+    def test_resolve_save_format(self):
+        self.assertEqual(("a/b.png", "png"), redback.plotting.Plotter._resolve_save_format("a/b.png"))
+        with matplotlib.rc_context({"savefig.format": "pdf"}):
+            self.assertEqual(("a/b.pdf", "pdf"), redback.plotting.Plotter._resolve_save_format("a/b"))
+
+    def test_pil_kwargs_only_for_png(self):
+        for buffered_save in [False, True]:
+            with mock.patch("matplotlib.pyplot.savefig") as savefig:
+                self._save("plot.png", buffered_save=buffered_save, pil_kwargs=dict(compress_level=1))
+                self._save("plot.pdf", buffered_save=buffered_save)
+                with matplotlib.rc_context({"savefig.format": "png"}):
+                    self._save("plot", buffered_save=buffered_save)
+            png_call, pdf_call, extensionless_call = savefig.call_args_list
+            self.assertDictEqual(dict(compress_level=1), png_call.kwargs["pil_kwargs"])
+            self.assertNotIn("pil_kwargs", pdf_call.kwargs)
+            self.assertDictEqual(dict(compress_level=3), extensionless_call.kwargs["pil_kwargs"])
+            self.assertEqual("png", extensionless_call.kwargs["format"])
+
+
+class TestPlotRandomModels(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.times = np.geomspace(1, 100, 50)
+        self.random_ys = [np.exp(-self.times / scale) * scale for scale in [5., 10., 20.]]
+
+    def tearDown(self) -> None:
+        plt.close("all")
+        del self.times
+        del self.random_ys
+
+    def _plot(self, use_collection: bool, scale: str) -> matplotlib.axes.Axes:
+        _, ax = plt.subplots()
+        ax.set_xscale(scale)
+        ax.set_yscale(scale)
+        plotter = redback.plotting.Plotter(transient=None, use_collection=use_collection)
+        plotter._plot_random_models(axes=ax, times=self.times, random_ys=self.random_ys, color="red", zorder=-1)
+        return ax
+
+    def test_single_line_collection(self):
+        ax = self._plot(use_collection=True, scale="linear")
+        self.assertEqual(0, len(ax.lines))
+        self.assertEqual(1, len(ax.collections))
+        self.assertIsInstance(ax.collections[0], matplotlib.collections.LineCollection)
+        self.assertEqual(len(self.random_ys), len(ax.collections[0].get_segments()))
+
+    def test_line_per_draw_fallback(self):
+        ax = self._plot(use_collection=False, scale="linear")
+        self.assertEqual(len(self.random_ys), len(ax.lines))
+        self.assertEqual(0, len(ax.collections))
+
+    def test_same_limits_as_lines(self):
+        for scale in ["linear", "log"]:
+            collection_ax = self._plot(use_collection=True, scale=scale)
+            lines_ax = self._plot(use_collection=False, scale=scale)
+            self.assertTrue(np.allclose(lines_ax.get_xlim(), collection_ax.get_xlim()))
+            self.assertTrue(np.allclose(lines_ax.get_ylim(), collection_ax.get_ylim()))
+
+    def test_no_draws(self):
+        ax = self._plot(use_collection=True, scale="linear")
+        redback.plotting.Plotter(transient=None)._plot_random_models(
+            axes=ax, times=self.times, random_ys=[], color="red", zorder=-1)
+        self.assertEqual(1, len(ax.collections))
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock
@@ -111,6 +112,21 @@ class TestTransient(unittest.TestCase):
         self.assertTrue(np.array_equal(self.transient.time_mjd, self.transient.x))
         self.assertTrue(np.array_equal(self.transient.time_mjd_err, self.transient.x_err))
 
+    def test_set_use_phase_model_time_attribute(self):
+        self.transient.time_mjd = np.array([57000, 57001, 57002])
+        self.transient.use_phase_model = True
+        self.assertTrue(np.array_equal(self.transient.time_mjd, self.transient.x))
+        self.transient.use_phase_model = False
+        self.assertTrue(np.array_equal(self.transient.time, self.transient.x))
+
+    def test_filtered_indices_without_bands(self):
+        self.transient.flux_data = True
+        self.transient.flux = self.y
+        self.transient.flux_err = self.y_err
+        filtered_x, _, filtered_y, _ = self.transient.get_filtered_data()
+        self.assertTrue(np.shares_memory(filtered_x, self.transient.x))
+        self.assertTrue(np.array_equal(self.y, filtered_y))
+
     def test_set_x(self):
         new_x = np.array([2, 3, 4])
         self.transient.x = new_x
@@ -141,6 +157,17 @@ class TestTransient(unittest.TestCase):
     def test_yerr_same_as_counts(self):
         self.assertTrue(np.array_equal(self.transient.y_err, self.transient.counts_err))
 
+    def test_counts_err_poisson_default(self):
+        self.assertEqual(np.int64, self.transient.counts.dtype)
+        self.assertTrue(np.array_equal(np.sqrt(self.y), self.transient.counts_err))
+        self.assertEqual(np.float64, self.transient.counts_err.dtype)
+
+    def test_counts_err_set_explicitly(self):
+        counts_err = np.array([1, 1, 1])
+        self.transient.counts_err = counts_err
+        self.assertIs(counts_err, self.transient.counts_err)
+        self.assertIs(counts_err, self.transient.y_err)
+
     def test_redshift(self):
         self.assertEqual(self.redshift, self.transient.redshift)
 
@@ -156,6 +183,20 @@ class TestTransient(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.transient.data_mode = "abc"
 
+    def test_plotter_class_dispatch(self):
+        self.transient.flux_data = True
+        self.assertIs(redback.plotting.IntegratedFluxPlotter, self.transient._get_plotter_class("single"))
+        self.transient.optical_data = True
+        self.assertIs(redback.plotting.IntegratedFluxOpticalPlotter, self.transient._get_plotter_class("single"))
+        self.assertIs(redback.plotting.IntegratedFluxPlotter, self.transient._get_plotter_class("residual"))
+        self.transient.counts_data = True
+        self.assertIsNone(self.transient._get_plotter_class("single"))
+
+    def test_plot_residual_illegal_data_mode(self):
+        self.transient.magnitude_data = True
+        with self.assertRaises(ValueError):
+            self.transient.plot_residual(model=None)
+
     def test_plot_lightcurve(self):
         pass
         # self.transient.plot_lightcurve(model=None)
@@ -219,6 +260,45 @@ class TestOpticalTransient(unittest.TestCase):
         self.assertTrue(np.array_equal(expected_bands, bands))
         self.assertTrue(np.array_equal(expected_system, system))
 
+    def test_load_data_parses_file_once(self):
+        processed_file_path = f"{dirname}/data/optical_transient_test_data.csv"
+        redback.transient.transient._read_processed_file.cache_clear()
+        self.addCleanup(redback.transient.transient._read_processed_file.cache_clear)
+        with mock.patch("pandas.read_csv", wraps=pd.read_csv) as m:
+            _, _, magnitude, _, _, _ = self.transient.load_data(processed_file_path=processed_file_path)
+            magnitude[0] = 0
+            _, _, magnitude, _, _, _ = self.transient.load_data(processed_file_path=processed_file_path)
+            m.assert_called_once()
+        self.assertTrue(np.allclose(np.array([17.48, 18.26]), magnitude))
+
+    def test_load_data_reads_modified_file_again(self):
+        redback.transient.transient._read_processed_file.cache_clear()
+        self.addCleanup(redback.transient.transient._read_processed_file.cache_clear)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            processed_file_path = f"{tmpdir}/optical_transient_test_data.csv"
+            with open(f"{dirname}/data/optical_transient_test_data.csv") as source, \
+                    open(processed_file_path, "w") as target:
+                target.write(source.read())
+            with mock.patch("pandas.read_csv", wraps=pd.read_csv) as m:
+                self.transient.load_data(processed_file_path=processed_file_path)
+                stat = os.stat(processed_file_path)
+                os.utime(processed_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+                self.transient.load_data(processed_file_path=processed_file_path)
+                self.assertEqual(2, m.call_count)
+
+    def test_load_data_precision(self):
+        processed_file_path = f"{dirname}/data/optical_transient_test_data.csv"
+        time_days, time_mjd, magnitude, magnitude_err, bands, system = \
+            self.transient.load_data(processed_file_path=processed_file_path)
+        self.assertEqual(redback.transient.transient.FLOAT_DTYPE, magnitude.dtype)
+        self.assertEqual(redback.transient.transient.FLOAT_DTYPE, magnitude_err.dtype)
+        self.assertEqual(np.float64, time_mjd.dtype)
+        self.assertEqual("U", system.dtype.kind)
+        _, _, magnitude, magnitude_err, _, _ = self.transient.load_data(
+            processed_file_path=processed_file_path, dtype=np.float64)
+        self.assertEqual(np.float64, magnitude.dtype)
+        self.assertEqual(np.float64, magnitude_err.dtype)
+
     def test_load_data_flux_density(self):
         name = "optical_transient_test_data"
         transient_dir = f"{dirname}/data"
@@ -268,6 +348,27 @@ class TestOpticalTransient(unittest.TestCase):
         self.assertTrue(np.array_equal(expected_bands, bands))
         self.assertTrue(np.array_equal(expected_system, system))
 
+    def test_load_data_generic_magnitude(self):
+        processed_file_path = f"{dirname}/data/optical_transient_test_data.csv"
+        time_days, time_mjd, magnitude, magnitude_err, bands = \
+            redback.transient.transient.Transient.load_data_generic(
+                processed_file_path=processed_file_path, data_mode="magnitude")
+        self.assertTrue(np.allclose(np.array([0.4813999999969383, 0.49020000000018626]), time_days))
+        self.assertTrue(np.allclose(np.array([57982.9814, 57982.9902]), time_mjd))
+        self.assertTrue(np.allclose(np.array([17.48, 18.26]), magnitude))
+        self.assertTrue(np.allclose(np.array([0.02, 0.15]), magnitude_err))
+        self.assertTrue(np.array_equal(np.array(["i", "H"]), bands))
+        self.assertEqual("U", bands.dtype.kind)
+        self.assertEqual(np.float64, time_mjd.dtype)
+        self.assertEqual(redback.transient.transient.FLOAT_DTYPE, magnitude.dtype)
+
+    def test_load_data_generic_double_precision(self):
+        processed_file_path = f"{dirname}/data/optical_transient_test_data.csv"
+        _, _, magnitude, magnitude_err, _ = redback.transient.transient.Transient.load_data_generic(
+            processed_file_path=processed_file_path, data_mode="magnitude", dtype=np.float64)
+        self.assertEqual(np.float64, magnitude.dtype)
+        self.assertEqual(np.float64, magnitude_err.dtype)
+
     def test_get_from_open_access_catalogue(self):
         with mock.patch("redback.transient.transient.OpticalTransient.load_data") as m:
             expected_time_days = np.array([0.4813999999969383, 0.49020000000018626])
@@ -298,6 +399,7 @@ class TestOpticalTransient(unittest.TestCase):
             self.assertTrue(np.allclose(expected_magnitude_err, transient.magnitude_err))
             self.assertTrue(np.array_equal(expected_bands, transient.bands))
             self.assertTrue(np.array_equal(expected_system, transient.system))
+            self.assertEqual("opticaltransient/test.csv", transient.directory_structure.processed_file_path)
 
     def test_set_active_bands(self):
         self.assertTrue(np.array_equal(np.array(self.active_bands), self.transient.active_bands))
@@ -351,6 +453,43 @@ class TestOpticalTransient(unittest.TestCase):
             self.transient.luminosity_data = True
             self.transient.get_filtered_data()
 
+    def test_filtered_indices_update_with_active_bands(self):
+        self.assertTrue(np.array_equal(np.array([False, True, True]), self.transient.filtered_indices))
+        self.transient.active_bands = np.array(['i'])
+        self.assertTrue(np.array_equal(np.array([True, False, False]), self.transient.filtered_indices))
+
+    def test_filtered_indices_update_with_bands(self):
+        self.transient.bands = np.array(['g', 'i', 'i'])
+        self.assertTrue(np.array_equal(np.array([True, False, False]), self.transient.filtered_indices))
+
+    def test_filtered_indices_mixed_band_types(self):
+        self.transient.bands = np.array(['g', 1, 'i'], dtype=object)
+        self.transient.active_bands = ['g', 1]
+        self.assertTrue(np.array_equal(np.array([True, True, False]), self.transient.filtered_indices))
+
+    def test_filtered_indices_single_and_no_active_bands(self):
+        self.transient.active_bands = 'i'
+        self.assertTrue(np.array_equal(np.array([True, False, False]), self.transient.filtered_indices))
+        self.transient.active_bands = None
+        self.assertTrue(np.array_equal(np.array([False, False, False]), self.transient.filtered_indices))
+
+    def test_filtered_indices_is_boolean_mask(self):
+        self.assertEqual(bool, self.transient.filtered_indices.dtype)
+        self.assertEqual(len(self.transient.bands), len(self.transient.filtered_indices))
+        self.assertEqual(2, sum(self.transient.filtered_indices))
+
+    def test_sncosmo_bands_converted_on_first_access(self):
+        with mock.patch("redback.utils.sncosmo_bandname_from_band") as m:
+            expected = np.array(['sdssi', 'sdssg', 'sdssg'])
+            m.return_value = expected
+            self.transient = redback.transient.transient.OpticalTransient(
+                time=self.time, time_err=self.time_err, flux_density=self.y, flux_density_err=self.y_err,
+                data_mode=self.data_mode, name=self.name, bands=self.bands, active_bands=self.active_bands)
+            m.assert_not_called()
+            self.assertTrue(np.array_equal(expected, self.transient.sncosmo_bands))
+            self.assertTrue(np.array_equal(expected, self.transient.sncosmo_bands))
+            m.assert_called_once()
+
     def test_meta_data_not_available(self):
         self.assertIsNone(self.transient.meta_data)
 
@@ -363,6 +502,18 @@ class TestOpticalTransient(unittest.TestCase):
         self.transient._set_data()
         self.assertDictEqual(expected, self.transient.meta_data)
 
+    def test_read_event_table_missing_fields_and_bad_lines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            event_table = f"{tmpdir}/test_metadata.csv"
+            with open(event_table, "w") as f:
+                f.write("name,ra,dec,alias\na,1.5,,x\nb,,2,NA\nc,3,4,z,extra\nd,010,5,\n")
+            meta_data = redback.transient.transient._read_event_table(event_table)
+            reference = pd.read_csv(event_table, on_bad_lines='skip', delimiter=',', dtype='str', engine='python')
+        pd.testing.assert_frame_equal(reference, meta_data)
+        self.assertListEqual(["a", "b", "d"], meta_data["name"].tolist())
+        self.assertListEqual(["1.5", "010"], meta_data["ra"].dropna().tolist())
+        self.assertListEqual([False, True, True], meta_data["alias"].isna().tolist())
+
     def test_transient_dir(self):
         with mock.patch('redback.get_data.directory.open_access_directory_structure') as m:
             expected = 'expected'
@@ -373,6 +524,11 @@ class TestOpticalTransient(unittest.TestCase):
         expected = np.array(['g', 'i'])
         self.assertTrue(np.array_equal(expected, self.transient.unique_bands))
 
+    def test_unique_bands_update_with_bands(self):
+        self.assertTrue(np.array_equal(np.array(['g', 'i']), self.transient.unique_bands))
+        self.transient.bands = np.array(['r', 'r', 'z'])
+        self.assertTrue(np.array_equal(np.array(['r', 'z']), self.transient.unique_bands))
+
     def test_list_of_band_indices(self):
         expected = [np.array([1, 2]), np.array([0])]
         self.assertTrue(np.array_equal(expected[0], self.transient.list_of_band_indices[0]))
@@ -383,11 +539,18 @@ class TestOpticalTransient(unittest.TestCase):
         self.assertListEqual(expected, self.transient.default_filters)
 
     def test_get_colors(self):
+        redback.transient.transient._rainbow_palette.cache_clear()
+        self.addCleanup(redback.transient.transient._rainbow_palette.cache_clear)
         with mock.patch('matplotlib.cm.rainbow') as m:
             expected = 'rainbow'
             m.return_value = expected
             self.assertEqual(expected, self.transient.get_colors(filters=['a', 'b']))
 
+    def test_get_colors_cached_per_length(self):
+        colors = self.transient.get_colors(filters=['a', 'b', 'c'])
+        self.assertEqual(3, len(colors))
+        self.assertIs(colors, self.transient.get_colors(filters=['x', 'y', 'z']))
+
 
 class TestAfterglow(unittest.TestCase):
 
@@ -1,4 +1,7 @@
 import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
 
 import redback
 
@@ -48,3 +51,32 @@ class TestTimeConversion(unittest.TestCase):
     def test_date_to_mjd(self):
         mjd = redback.utils.date_to_mjd(year=self.year, month=self.month, day=self.day)
         self.assertEqual(self.mjd, mjd)
+
+
+class TestBinTTEs(unittest.TestCase):
+
+    def test_bin_ttes(self):
+        ttes = np.array([0., 0.5, 1.5, 2.2, 2.7, 3.1, 4.])
+        times, counts = redback.utils.bin_ttes(ttes=ttes, bin_size=1.)
+        self.assertTrue(np.allclose(np.array([0.5, 1.5, 2.5]), times))
+        self.assertTrue(np.array_equal(np.array([2, 1, 2]), counts))
+
+
+class TestFiltersTableMapping(unittest.TestCase):
+
+    def setUp(self) -> None:
+        redback.utils._filters_table_mapping.cache_clear()
+
+    def tearDown(self) -> None:
+        redback.utils._filters_table_mapping.cache_clear()
+
+    def test_bands_to_frequency_reads_table_once(self):
+        with mock.patch("pandas.read_csv", wraps=pd.read_csv) as m:
+            first = redback.utils.bands_to_frequency(["g", "r"])
+            second = redback.utils.bands_to_frequency(["r", "g"])
+            m.assert_called_once()
+        self.assertTrue(np.array_equal(first[::-1], second))
+
+    def test_unknown_band_raises(self):
+        with self.assertRaises(KeyError):
+            redback.utils.bands_to_frequency(["not_a_band"])